@@ -0,0 +1,77 @@
+"""Push order increments at a few hot cooks, one write per order versus
+through the coalescing counters.
+
+    python scripts/bench_counters.py [orders_per_second] [seconds] [cooks]
+"""
+import json
+import os
+import random
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app  # noqa: E402
+
+
+def main(rate='10000', seconds='5', cooks='5'):
+    rate, seconds, cooks = int(rate), float(seconds), int(cooks)
+    app.init_sample_data()
+    emails = [c['email'] for c in app.sample_cooks[:cooks]]
+    threads = 32
+
+    def direct(email):
+        if app.USE_COLLECTIONS:
+            app.users_col.update_one({'email': email}, {'$inc': {'totalOrders': 1}})
+        else:
+            app.memory_update('users', {'email': email}, {}, inc={'totalOrders': 1})
+
+    def coalesced(email):
+        app.counters.incr('users', email, {'totalOrders': 1})
+
+    def total_orders():
+        if app.USE_COLLECTIONS:
+            return sum(u.get('totalOrders') or 0 for u in app.users_col.find({'email': {'$in': emails}}))
+        return sum(u.get('totalOrders') or 0 for u in app.users_data if u['email'] in emails)
+
+    results = {}
+    for label, increment in (('direct', direct), ('coalesced', coalesced)):
+        start_total = total_orders()
+        written_before = app.counters.documents_written
+        latencies = [[] for _ in range(threads)]
+        interval = threads / rate
+        started = time.monotonic()
+
+        def worker(n):
+            due = started + n * interval / threads
+            while due < started + seconds:
+                pause = due - time.monotonic()
+                if pause > 0:
+                    time.sleep(pause)
+                increment(emails[random.randrange(len(emails))])
+                # Measured from the scheduled time, so falling behind shows up as latency
+                latencies[n].append(time.monotonic() - due)
+                due += interval
+
+        pool = [threading.Thread(target=worker, args=(n,)) for n in range(threads)]
+        for t in pool:
+            t.start()
+        for t in pool:
+            t.join()
+        elapsed = time.monotonic() - started
+        app.counters.flush()
+        done = sorted(l for per_thread in latencies for l in per_thread)
+        results[label] = {
+            'orders': len(done),
+            'ordersPerSecond': round(len(done) / elapsed),
+            'p50Ms': round(done[len(done) // 2] * 1000, 3),
+            'p99Ms': round(done[int(len(done) * 0.99)] * 1000, 3),
+            'storageWrites': len(done) if label == 'direct' else app.counters.documents_written - written_before,
+            'countedCorrectly': total_orders() - start_total == len(done)
+        }
+    print(json.dumps({'targetPerSecond': rate, 'cooks': len(emails), 'results': results}, indent=2))
+
+
+if __name__ == '__main__':
+    main(*sys.argv[1:])
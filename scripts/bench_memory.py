@@ -0,0 +1,43 @@
+"""Compare bytes per in-memory dish for plain dicts and DishRecord.
+
+    python scripts/bench_memory.py [records]
+"""
+import json
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import DishRecord, sample_dishes  # noqa: E402
+
+
+def fresh(value):
+    # Each record gets its own string objects, as if decoded from a request or the journal
+    return (value + ' ')[:-1] if isinstance(value, str) else value
+
+
+def make_docs(n):
+    for i in range(n):
+        doc = {k: fresh(v) for k, v in sample_dishes[i % len(sample_dishes)].items()}
+        doc['_id'] = str(i)
+        doc['name'] = f"{doc['name']} {i}"
+        yield doc
+
+
+def main(count='1000000'):
+    count = int(count)
+    results = {}
+    for label, build in (('dict', dict), ('DishRecord', DishRecord)):
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        records = [build(doc) for doc in make_docs(count)]
+        used = tracemalloc.get_traced_memory()[0] - before
+        tracemalloc.stop()
+        results[label] = round(used / count, 1)
+        del records
+    print(json.dumps({'records': count, 'bytesPerRecord': results}, indent=2))
+
+
+if __name__ == '__main__':
+    main(*sys.argv[1:])
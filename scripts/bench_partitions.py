@@ -0,0 +1,53 @@
+"""Per-city lookups from the city shards versus a scan of one flat catalog,
+as the number of cities grows.
+
+    python scripts/bench_partitions.py [cooks_per_city] [dishes_per_cook] [lookups]
+"""
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import CityShards  # noqa: E402
+
+
+def main(cooks_per_city='50', dishes_per_cook='10', lookups='2000'):
+    cooks_per_city, dishes_per_cook, lookups = int(cooks_per_city), int(dishes_per_cook), int(lookups)
+    rows = []
+    for num_cities in (5, 20, 80, 320):
+        cooks, dishes = CityShards('email'), CityShards('_id')
+        all_cooks, all_dishes = [], []
+        for c in range(num_cities):
+            city = f'City {c}'
+            for k in range(cooks_per_city):
+                cook = {'email': f'cook{k}@city{c}.test', 'type': 'cook', 'city': city}
+                all_cooks.append(cook)
+                for d in range(dishes_per_cook):
+                    all_dishes.append({'_id': f'{c}-{k}-{d}', 'cookEmail': cook['email'], 'city': city})
+        cooks.add_many(all_cooks)
+        dishes.add_many(all_dishes)
+        picks = [random.choice(all_cooks) for _ in range(lookups)]
+
+        def timed(fn):
+            started = time.perf_counter()
+            for cook in picks:
+                fn(cook)
+            return round((time.perf_counter() - started) / lookups * 1e6, 1)
+
+        rows.append({
+            'cities': num_cities,
+            'dishes': len(all_dishes),
+            'partitionedUs': timed(lambda cook: (cooks.in_city(cook['city']),
+                                                 dishes.of_cook(cook['email'], cooks.city_of(cook['email'])))),
+            'fullScanUs': timed(lambda cook: ([c for c in all_cooks if c['city'] == cook['city']],
+                                              [d for d in all_dishes if d['cookEmail'] == cook['email']]))
+        })
+    print(json.dumps({'cooksPerCity': cooks_per_city, 'dishesPerCook': dishes_per_cook,
+                      'usPerCityQuery': rows}, indent=2))
+
+
+if __name__ == '__main__':
+    main(*sys.argv[1:])
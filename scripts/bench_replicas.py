@@ -0,0 +1,71 @@
+"""Catalog read throughput with reads confined to the primary, then one, two
+and all members of the local replica set from scripts/replica_set.py.
+
+    MONGO_URI=... python scripts/bench_replicas.py [seconds] [threads]
+"""
+import json
+import os
+import random
+import sys
+import threading
+import time
+
+from pymongo.errors import PyMongoError
+from pymongo.read_concern import ReadConcern
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app  # noqa: E402
+
+
+def main(seconds='10', threads='32'):
+    if not app.USE_MONGODB:
+        print("Set MONGO_URI to a replica set first (python scripts/replica_set.py starts one)")
+        return
+    seconds, threads = float(seconds), int(threads)
+    app.init_sample_data()
+    cooks = [c['email'] for c in app.users_col.find({'type': 'cook'}, {'email': 1})]
+    cities = sorted({c.get('city') or app.OTHER_CITY for c in app.users_col.find({'type': 'cook'}, {'city': 1})})
+    setups = [('primary', app.catalog_read_preference('primary')),
+              ('1 secondary', app.catalog_read_preference('secondary', [{'pool1': 'yes'}])),
+              ('2 secondaries', app.catalog_read_preference('secondary', [{'pool2': 'yes'}])),
+              ('primary + 2 secondaries', app.catalog_read_preference('nearest'))]
+    rows = []
+    for label, preference in setups:
+        catalog = app.client.get_database('homemealsdb', read_preference=preference, read_concern=ReadConcern('local'))
+        users, menu = catalog['users'], catalog['menu_items']
+        latencies = [[] for _ in range(threads)]
+        deadline = time.monotonic() + seconds
+
+        def worker(n):
+            while time.monotonic() < deadline:
+                started = time.monotonic()
+                pick = random.random()
+                if pick < 0.3:
+                    list(users.find({'type': 'cook', 'city': random.choice(cities)}))
+                elif pick < 0.6:
+                    users.find_one({'email': random.choice(cooks), 'type': 'cook'})
+                else:
+                    list(menu.find({'cookEmail': random.choice(cooks)}))
+                latencies[n].append(time.monotonic() - started)
+
+        try:
+            users.find_one({})
+        except PyMongoError as e:
+            rows.append({'readsFrom': label, 'error': str(e).split(',')[0]})
+            continue
+        pool = [threading.Thread(target=worker, args=(n,)) for n in range(threads)]
+        for t in pool:
+            t.start()
+        for t in pool:
+            t.join()
+        done = sorted(l for per_thread in latencies for l in per_thread)
+        rows.append({'readsFrom': label, 'reads': len(done), 'readsPerSecond': round(len(done) / seconds),
+                     'p50Ms': round(done[len(done) // 2] * 1000, 2) if done else None,
+                     'p99Ms': round(done[int(len(done) * 0.99)] * 1000, 2) if done else None})
+    print(json.dumps({'threads': threads, 'seconds': seconds, 'maxStalenessSeconds': app.MONGO_MAX_STALENESS_SECONDS,
+                      'results': rows}, indent=2))
+
+
+if __name__ == '__main__':
+    main(*sys.argv[1:])
@@ -0,0 +1,46 @@
+"""Start a local three-member replica set (needs mongod on PATH) and print
+its MONGO_URI.
+
+    python scripts/replica_set.py [base_port] [dbpath]
+"""
+import os
+import subprocess
+import sys
+import time
+
+from pymongo import MongoClient
+from pymongo.errors import PyMongoError
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPLICA_SET_NAME = 'rs0'
+# Tags on the secondaries, so scripts/bench_replicas.py can allow one or both of them
+REPLICA_BENCH_TAGS = [{}, {'pool1': 'yes', 'pool2': 'yes'}, {'pool2': 'yes'}]
+
+
+def main(base_port='27017', dbpath=None):
+    base_port = int(base_port)
+    dbpath = dbpath or os.path.join(BASE_DIR, 'data', 'replica-set')
+    ports = [base_port + i for i in range(len(REPLICA_BENCH_TAGS))]
+    for port in ports:
+        member_path = os.path.join(dbpath, str(port))
+        os.makedirs(member_path, exist_ok=True)
+        subprocess.run(['mongod', '--replSet', REPLICA_SET_NAME, '--port', str(port), '--bind_ip', 'localhost',
+                        '--dbpath', member_path, '--logpath', os.path.join(member_path, 'mongod.log'), '--fork'],
+                       check=True)
+    seed = MongoClient(f'mongodb://localhost:{ports[0]}/?directConnection=true', serverSelectionTimeoutMS=10000)
+    members = [{'_id': i, 'host': f'localhost:{port}', 'priority': 2 if i == 0 else 1, 'tags': tags}
+               for i, (port, tags) in enumerate(zip(ports, REPLICA_BENCH_TAGS))]
+    try:
+        seed.admin.command('replSetInitiate', {'_id': REPLICA_SET_NAME, 'members': members})
+    except PyMongoError as e:
+        print(f"replSetInitiate: {e}")
+    for _ in range(60):
+        if seed.admin.command('hello').get('isWritablePrimary'):
+            break
+        time.sleep(1)
+    hosts = ','.join(f'localhost:{port}' for port in ports)
+    print(f"MONGO_URI=mongodb://{hosts}/?replicaSet={REPLICA_SET_NAME}")
+
+
+if __name__ == '__main__':
+    main(*sys.argv[1:])
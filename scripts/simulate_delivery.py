@@ -0,0 +1,78 @@
+"""Replay a synthetic order stream through the delivery batching stage and
+report trips saved and solve times.
+
+    python scripts/simulate_delivery.py [orders] [max_batch_size] [max_detour_km] [window_minutes]
+"""
+import json
+import math
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import DELIVERY_WINDOW_MINUTES, distance_km, plan_delivery_batches  # noqa: E402
+
+
+def simulate_delivery_batching(num_orders=2000, cooks=20, orders_per_hour_per_cook=12, radius_km=8,
+                               max_batch_size=None, max_detour_km=None, window_minutes=None, seed=42):
+    rng = random.Random(seed)
+    solve_times, total_orders, total_trips = [], 0, 0
+    batched_km = direct_km = 0.0
+    per_cook = max(1, num_orders // cooks)
+    for _ in range(cooks):
+        origin = {'lat': 12.9 + rng.random(), 'lng': 77.5 + rng.random()}
+        now, orders = 0.0, []
+        for i in range(per_cook):
+            now += rng.expovariate(orders_per_hour_per_cook / 3600)
+            distance = radius_km * math.sqrt(rng.random())
+            bearing = rng.random() * 2 * math.pi
+            orders.append({
+                'orderId': f'SIM-{i}',
+                'readyAt': now,
+                'location': {'lat': origin['lat'] + distance * math.cos(bearing) / 111.0,
+                             'lng': origin['lng'] + distance * math.sin(bearing) / (111.0 * math.cos(math.radians(origin['lat'])))}
+            })
+        # Replay in one-window slices, as the batching stage would see them live
+        window = (DELIVERY_WINDOW_MINUTES if window_minutes is None else window_minutes) * 60
+        start = 0
+        while start < len(orders):
+            end = start
+            while end < len(orders) and orders[end]['readyAt'] - orders[start]['readyAt'] <= window:
+                end += 1
+            chunk = orders[start:end]
+            started = time.perf_counter()
+            trips = plan_delivery_batches(origin, chunk, max_batch_size, max_detour_km, window_minutes)
+            solve_times.append((time.perf_counter() - started) * 1000)
+            total_trips += len(trips)
+            batched_km += sum(t['distanceKm'] for t in trips)
+            direct_km += sum(distance_km(origin, o['location']) for o in chunk)
+            start = end
+        total_orders += len(orders)
+    solve_times.sort()
+    return {
+        'orders': total_orders,
+        'trips': total_trips,
+        'tripsSaved': total_orders - total_trips,
+        'tripsSavedPercent': round(100 * (total_orders - total_trips) / max(total_orders, 1), 1),
+        'batchedKm': round(batched_km, 1),
+        'singleDropKm': round(direct_km, 1),
+        'solveMsMean': round(statistics.mean(solve_times), 3) if solve_times else 0,
+        'solveMsP99': round(solve_times[int(0.99 * (len(solve_times) - 1))], 3) if solve_times else 0
+    }
+
+
+def main(num_orders='2000', max_batch_size=None, max_detour_km=None, window_minutes=None):
+    report = simulate_delivery_batching(
+        int(num_orders),
+        max_batch_size=int(max_batch_size) if max_batch_size else None,
+        max_detour_km=float(max_detour_km) if max_detour_km else None,
+        window_minutes=float(window_minutes) if window_minutes else None
+    )
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == '__main__':
+    main(*sys.argv[1:])
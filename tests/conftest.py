@@ -0,0 +1,40 @@
+import os
+import sys
+import tempfile
+
+import pytest
+
+# app.py picks its storage and background jobs at import time, so configure
+# a throwaway SQLite store before it is imported.
+TEST_DATA = tempfile.mkdtemp(prefix='homemeals-tests-')
+os.environ.update({
+    'STORAGE_BACKEND': 'sqlite',
+    'SQLITE_PATH': os.path.join(TEST_DATA, 'homemeals.sqlite3'),
+    'MEMORY_JOURNAL': '0',
+    'MEMORY_DATA_FOLDER': os.path.join(TEST_DATA, 'memory'),
+    'COUNTER_JOURNAL_FOLDER': os.path.join(TEST_DATA, 'counters'),
+    'ORDER_ARCHIVE_FOLDER': os.path.join(TEST_DATA, 'orders-archive'),
+    'ORDER_ARCHIVE_INTERVAL_HOURS': '0',
+    'ANALYTICS_REBUILD_MINUTES': '0',
+    'ANALYTICS_FOLDER': os.path.join(TEST_DATA, 'analytics'),
+    'STATIC_CATALOG_FOLDER': os.path.join(TEST_DATA, 'catalog'),
+    'STATIC_CATALOG_STATE_PATH': os.path.join(TEST_DATA, 'static-catalog-state.json'),
+    'UPLOAD_SESSION_FOLDER': os.path.join(TEST_DATA, 'uploads'),
+    'SECRET_KEY': 'test-secret',
+    'RATE_LIMIT_PER_SECOND': '100000',
+    'RATE_LIMIT_BURST': '100000',
+})
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app as app_module  # noqa: E402
+
+
+@pytest.fixture(scope='session')
+def homemeals():
+    app_module.init_sample_data()
+    return app_module
+
+
+@pytest.fixture
+def client(homemeals):
+    return homemeals.app.test_client()
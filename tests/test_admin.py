@@ -0,0 +1,24 @@
+import os
+
+import pytest
+
+
+@pytest.fixture
+def admin(homemeals, monkeypatch):
+    monkeypatch.setattr(homemeals, 'ADMIN_TOKEN', 'admin-secret')
+    return {'X-Admin-Token': 'admin-secret'}
+
+
+def test_partition_move_requires_admin(homemeals, client, admin):
+    cook = homemeals.sample_cooks[5]
+    body = {'cookEmail': cook['email'], 'city': cook.get('city')}
+    assert client.post('/api/admin/partitions/move', json=body).status_code == 403
+    assert client.post('/api/admin/partitions/move', json=body, headers=admin).status_code == 200
+
+
+def test_static_catalog_build_requires_admin(homemeals, client, admin):
+    assert client.post('/api/admin/static-catalog/build').status_code == 403
+    response = client.post('/api/admin/static-catalog/build', headers=admin)
+    assert response.status_code == 200
+    assert response.get_json()['full']
+    assert os.path.exists(os.path.join(homemeals.STATIC_CATALOG_FOLDER, 'catalog.json'))
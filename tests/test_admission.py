@@ -0,0 +1,58 @@
+import threading
+import time
+
+from flask import jsonify
+
+
+def test_p99_latency_stays_bounded_under_overload(homemeals, monkeypatch):
+    """64 simultaneous requests against 4 slots: the excess is shed quickly instead of queueing without bound"""
+    work = 0.05
+    deadline = 0.2
+
+    def slow_view():
+        time.sleep(work)
+        return jsonify({'ok': True}), 200
+
+    monkeypatch.setitem(homemeals.app.view_functions, 'get_cooks', slow_view)
+    monkeypatch.setitem(homemeals.admission_controllers, 'read',
+                        homemeals.AdmissionController('read', 4, 8, deadline))
+    results = []
+    lock = threading.Lock()
+    start = threading.Barrier(64)
+
+    def call():
+        client = homemeals.app.test_client()
+        start.wait()
+        began = time.monotonic()
+        response = client.get('/api/cooks')
+        with lock:
+            results.append((response.status_code, time.monotonic() - began))
+
+    threads = [threading.Thread(target=call) for _ in range(64)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    statuses = [status for status, _ in results]
+    assert set(statuses) <= {200, 503}
+    assert statuses.count(200) >= 4
+    assert statuses.count(503) > 0
+    latencies = sorted(elapsed for _, elapsed in results)
+    p99 = latencies[int(len(latencies) * 0.99) - 1]
+    # Unbounded queueing would take 64 / 4 * work = 0.8s for the last request
+    assert p99 < deadline + 2 * work + 0.2
+
+
+def test_forwarded_for_is_ignored_without_trusted_proxies(homemeals):
+    with homemeals.app.test_request_context('/', headers={'X-Forwarded-For': '203.0.113.9'},
+                                            environ_base={'REMOTE_ADDR': '10.0.0.1'}):
+        assert homemeals.get_client_id() == '10.0.0.1'
+
+
+def test_rate_limiter_rejects_after_burst(homemeals):
+    limiter = homemeals.TokenBucketLimiter(rate=1, burst=3)
+    assert [limiter.allow('client')[0] for _ in range(4)] == [True, True, True, False]
+    allowed, retry_after = limiter.allow('client')
+    assert not allowed and retry_after >= 1
+    assert limiter.allow('other')[0]
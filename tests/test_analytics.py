@@ -0,0 +1,83 @@
+from datetime import datetime
+
+import pytest
+
+COOK = 'analytics-cook@x.test'
+
+
+@pytest.fixture
+def workers(homemeals, monkeypatch, tmp_path):
+    """Two workers' rollups sharing one analytics folder; use() makes one of them the current process"""
+    monkeypatch.setattr(homemeals, 'ANALYTICS_REBUILD_INTERVAL', 60)
+    monkeypatch.setattr(homemeals, 'ANALYTICS_FOLDER', str(tmp_path))
+    state = {'leader': (homemeals.CookAnalytics(), None), 'follower': (homemeals.CookAnalytics(), None)}
+
+    def use(name):
+        state[current[0]] = (homemeals.analytics, homemeals.analytics_leader)
+        rollups, lock = state[name]
+        monkeypatch.setattr(homemeals, 'analytics', rollups)
+        monkeypatch.setattr(homemeals, 'analytics_leader', lock)
+        current[0] = name
+        return rollups
+
+    current = ['leader']
+    monkeypatch.setattr(homemeals, 'analytics', state['leader'][0])
+    monkeypatch.setattr(homemeals, 'analytics_leader', None)
+    yield use
+    use('leader')
+    for _, lock in state.values():
+        if lock is not None:
+            lock.close()
+
+
+def take_order(homemeals, order_id, amount):
+    order = {'orderId': order_id, 'cookEmail': COOK, 'createdAt': datetime.utcnow(), 'totalAmount': amount,
+             'items': [{'dishId': 'd1', 'dishName': 'Dal', 'quantity': 1, 'price': amount}], 'status': 'pending'}
+    homemeals.orders_col.insert_one(dict(order))
+    return order
+
+
+def totals(rollups):
+    today = datetime.utcnow().toordinal()
+    return rollups.query(COOK, today, today)['totals']
+
+
+def test_rebuild_route_requires_admin(homemeals, client, monkeypatch):
+    monkeypatch.setattr(homemeals, 'ADMIN_TOKEN', 'admin-secret')
+    assert client.post('/api/admin/analytics/rebuild').status_code == 403
+    assert client.post('/api/admin/analytics/rebuild', headers={'X-Admin-Token': 'admin-secret'}).status_code == 200
+
+
+def test_elected_worker_catches_up_and_the_others_load_its_snapshot(homemeals, workers):
+    leader = workers('leader')
+    homemeals.refresh_analytics()
+    assert leader.rebuilds == 1
+    before = totals(leader)
+
+    # Another process takes an order: only the elected worker reads it, incrementally
+    take_order(homemeals, 'AN-1', 100)
+    report = homemeals.refresh_analytics()
+    assert report['applied'] == 1 and leader.rebuilds == 1
+    assert totals(leader)['orders'] == before['orders'] + 1
+    # An order recorded here is already in the rollups, so the next catch-up skips it
+    leader.record_order(take_order(homemeals, 'AN-2', 50))
+    assert homemeals.refresh_analytics()['applied'] == 0
+    assert totals(leader)['revenue'] == before['revenue'] + 150
+
+    follower = workers('follower')
+    assert homemeals.refresh_analytics() is None
+    assert follower.rebuilds == 0 and totals(follower) == totals(leader)
+
+    # The follower keeps its own order across loads of snapshots that lack it, and counts it once after
+    follower.record_order(take_order(homemeals, 'AN-3', 25))
+    workers('leader')
+    homemeals.publish_analytics()
+    workers('follower')
+    homemeals.refresh_analytics()
+    assert totals(follower)['orders'] == before['orders'] + 3
+    workers('leader')
+    assert homemeals.refresh_analytics()['applied'] == 1
+    workers('follower')
+    homemeals.refresh_analytics()
+    assert totals(follower)['orders'] == before['orders'] + 3
+    assert follower.unpublished == []
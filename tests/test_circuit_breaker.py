@@ -0,0 +1,80 @@
+import time
+
+import pytest
+from pymongo.errors import AutoReconnect, DuplicateKeyError
+
+
+@pytest.fixture
+def breaker(homemeals):
+    return homemeals.CircuitBreaker(failure_threshold=3, reset_seconds=0.05, timeout=1)
+
+
+def fail(error):
+    def fn():
+        raise error
+    return fn
+
+
+def trip(breaker):
+    for _ in range(3):
+        with pytest.raises(AutoReconnect):
+            breaker.call(fail(AutoReconnect('down')))
+    assert breaker.state == 'open'
+
+
+def test_opens_after_consecutive_outages_and_rejects(homemeals, breaker):
+    breaker.call(lambda: 'ok')
+    with pytest.raises(AutoReconnect):
+        breaker.call(fail(AutoReconnect('down')))
+    assert breaker.state == 'closed'
+    breaker.call(lambda: 'ok')
+    assert breaker.failures == 0
+    trip(breaker)
+    with pytest.raises(homemeals.StorageUnavailable):
+        breaker.call(lambda: 'ok')
+    assert breaker.stats()['rejectedCalls'] == 1
+
+
+def test_server_errors_do_not_count_as_outages(breaker):
+    for _ in range(5):
+        with pytest.raises(DuplicateKeyError):
+            breaker.call(fail(DuplicateKeyError('dup')))
+    assert breaker.state == 'closed'
+    assert breaker.failures == 0
+
+
+def test_successful_probe_closes(breaker):
+    trip(breaker)
+    time.sleep(0.06)
+    assert breaker.call(lambda: 'ok') == 'ok'
+    assert breaker.state == 'closed'
+
+
+def test_failed_probe_reopens(homemeals, breaker):
+    trip(breaker)
+    time.sleep(0.06)
+    with pytest.raises(AutoReconnect):
+        breaker.call(fail(AutoReconnect('still down')))
+    assert breaker.state == 'open'
+    with pytest.raises(homemeals.StorageUnavailable):
+        breaker.call(lambda: 'ok')
+
+
+def test_probe_raising_another_error_does_not_wedge_half_open(homemeals, breaker):
+    trip(breaker)
+    time.sleep(0.06)
+    with pytest.raises(ValueError):
+        breaker.call(fail(ValueError('bad document')))
+    assert breaker.state == 'open'
+    time.sleep(0.06)
+    assert breaker.call(lambda: 'ok') == 'ok'
+    assert breaker.state == 'closed'
+
+
+def test_other_errors_while_closed_leave_the_count_alone(breaker):
+    with pytest.raises(AutoReconnect):
+        breaker.call(fail(AutoReconnect('down')))
+    with pytest.raises(KeyError):
+        breaker.call(fail(KeyError('x')))
+    assert breaker.state == 'closed'
+    assert breaker.failures == 1
@@ -0,0 +1,111 @@
+import json
+import os
+import threading
+
+import pytest
+
+
+@pytest.fixture
+def cook(homemeals):
+    return homemeals.sample_cooks[2]['email']
+
+
+def total_orders(homemeals, email):
+    return homemeals.users_col.find_one({'email': email, 'type': 'cook'}).get('totalOrders') or 0
+
+
+def open_counters(homemeals, root):
+    counters = homemeals.CoalescingCounters(str(root), 4, 3600)
+    counters.open()
+    return counters
+
+
+def test_threads_spread_over_shards(homemeals, tmp_path):
+    counters = homemeals.CoalescingCounters(str(tmp_path), 4, 3600)
+    picked = []
+
+    def pick():
+        picked.append(id(counters.shard()))
+
+    threads = [threading.Thread(target=pick) for _ in range(4)]
+    for t in threads:
+        t.start()
+        t.join()
+    assert len(set(picked)) == 4
+
+
+def test_flush_writes_one_batch_per_writer(homemeals, tmp_path, cook):
+    before = total_orders(homemeals, cook)
+    counters = open_counters(homemeals, tmp_path)
+    for _ in range(5):
+        counters.incr('users', cook, {'totalOrders': 1})
+    counters.flush()
+    counters.close()
+
+    assert total_orders(homemeals, cook) == before + 5
+    stored = homemeals.users_col.find_one({'email': cook, 'type': 'cook'})
+    assert set(stored['counterSeq']) >= {counters.writer}
+    profile = homemeals.get_user_profile(cook, 'cook')
+    assert 'counterSeq' not in profile and 'ratingSum' not in profile
+
+
+def test_batches_from_other_writers_are_not_skipped(homemeals, cook):
+    before = total_orders(homemeals, cook)
+    batch = {('users', cook): {'totalOrders': 1}}
+    homemeals.write_counter_batch(batch, 2000, 'writer-a')
+    # An older sequence number from another process is a different batch, not a replay
+    homemeals.write_counter_batch(batch, 1000, 'writer-b')
+    assert total_orders(homemeals, cook) == before + 2
+    # Replaying either batch changes nothing
+    homemeals.write_counter_batch(batch, 2000, 'writer-a')
+    homemeals.write_counter_batch(batch, 1000, 'writer-b')
+    assert total_orders(homemeals, cook) == before + 2
+
+
+def test_crashed_writer_journal_is_replayed_once(homemeals, tmp_path, cook):
+    before = total_orders(homemeals, cook)
+    crashed = open_counters(homemeals, tmp_path)
+    crashed.stop.set()
+    for _ in range(3):
+        crashed.incr('users', cook, {'totalOrders': 1})
+    with open(crashed.log_path()) as f:
+        assert [json.loads(line) for line in f] == [['users', cook, {'totalOrders': 1}]] * 3
+    # The process dies without flushing: its lock goes away with it
+    os.close(crashed.fd)
+    crashed.lock_file.close()
+
+    survivor = open_counters(homemeals, tmp_path)
+    assert survivor.writer == crashed.writer
+    assert survivor.recovered_segments == 1
+    assert total_orders(homemeals, cook) == before + 3
+    assert not [f for f in os.listdir(survivor.folder) if f.endswith('.segment')]
+    survivor.close()
+
+
+def test_written_segment_is_not_applied_twice(homemeals, tmp_path, cook):
+    counters = open_counters(homemeals, tmp_path)
+    counters.incr('users', cook, {'totalOrders': 2})
+    counters.flush()
+    applied = total_orders(homemeals, cook)
+    seq = homemeals.users_col.find_one({'email': cook, 'type': 'cook'})['counterSeq'][counters.writer]
+    counters.close()
+
+    # A crash between writing a batch and deleting its segment leaves the segment behind
+    with open(os.path.join(tmp_path, counters.writer, f'{seq}.segment'), 'w') as f:
+        f.write(json.dumps(['users', cook, {'totalOrders': 2}]) + '\n')
+    reopened = open_counters(homemeals, tmp_path)
+    assert reopened.recovered_segments == 1
+    assert total_orders(homemeals, cook) == applied
+    reopened.close()
+
+
+def test_second_rating_for_an_order_is_rejected(homemeals, client):
+    dish = next(iter(homemeals.menu_col.find({'isAvailable': True})))
+    order = client.post('/api/orders/create', json={
+        'customerName': 'Rater', 'customerPhone': '1', 'customerAddress': 'a', 'customerEmail': 'rater@x.test',
+        'items': [{'dishId': str(dish['_id']), 'quantity': 1}]
+    }).get_json()['order']
+    first = client.post('/api/ratings', json={'orderId': order['orderId'], 'rating': 5})
+    second = client.post('/api/ratings', json={'orderId': order['orderId'], 'rating': 1})
+    assert first.status_code == 201
+    assert second.status_code == 409
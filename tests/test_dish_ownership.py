@@ -0,0 +1,19 @@
+def auth(homemeals, email, user_type='cook'):
+    token, _ = homemeals.issue_session_token({'email': email, 'type': user_type})
+    return {'Authorization': f'Bearer {token}'}
+
+
+def test_only_the_owning_cook_can_change_a_dish(homemeals, client):
+    owner, other = homemeals.sample_cooks[3]['email'], homemeals.sample_cooks[4]['email']
+    dish = next(iter(homemeals.menu_col.find({'cookEmail': owner})))
+    url = f"/api/dishes/{dish['_id']}"
+
+    assert client.put(url, json={'price': 1}).status_code == 401
+    assert client.put(url, json={'price': 1}, headers=auth(homemeals, other)).status_code == 403
+    assert client.delete(url, headers=auth(homemeals, other)).status_code == 403
+
+    response = client.put(url, json={'price': 321}, headers=auth(homemeals, owner))
+    assert response.status_code == 200
+    assert response.get_json()['dish']['price'] == 321
+    assert client.delete(url, headers=auth(homemeals, owner)).status_code == 200
+    assert client.delete(url, headers=auth(homemeals, owner)).status_code == 404
@@ -0,0 +1,50 @@
+def make_dish(dish_id, **fields):
+    dish = {'_id': dish_id, 'city': 'Bangalore', 'category': 'Main Course', 'cuisine': 'South Indian',
+            'spiceLevel': 'Mild', 'isVegetarian': True, 'isAvailable': True, 'price': 150, 'calories': 400}
+    dish.update(fields)
+    return dish
+
+
+def test_counts_and_facets_follow_adds_and_removes(homemeals):
+    index = homemeals.DishFacetIndex()
+    index.add_many([
+        make_dish('a'),
+        make_dish('b', cuisine='North Indian', price=250),
+        make_dish('c', cuisine='North Indian', isVegetarian=False, price=90),
+    ])
+    matched, facets = index.query({'cuisine': ['North Indian']}, {})
+    assert matched.bit_count() == 2
+    # A facet is counted against every filter but its own
+    assert facets['cuisine'] == {'South Indian': 1, 'North Indian': 2}
+    assert facets['isVegetarian'] == {True: 1, False: 1}
+    assert [d['_id'] for d in index.dishes(matched)] == ['c', 'b']
+
+    index.add(make_dish('b', cuisine='South Indian', price=250))
+    index.remove('c')
+    matched, facets = index.query({}, {'price': (100, 300)})
+    assert matched.bit_count() == 2
+    assert index.counts['cuisine'] == {'South Indian': 2, 'North Indian': 0}
+    assert facets['priceBand'] == {'100-199': 1, '200-299': 1}
+
+
+def test_index_picks_up_writes_from_other_workers(homemeals, client, monkeypatch):
+    monkeypatch.setattr(homemeals, 'FACET_REFRESH_SECONDS', 0)
+    cook = homemeals.sample_cooks[0]
+    before = client.get('/api/dishes/filter?cuisine=Martian&isAvailable=any').get_json()
+    assert before['count'] == 0
+
+    # Another worker adds two dishes and deletes one, writing only to the shared database
+    for dish_id in ('remote-1', 'remote-2'):
+        homemeals.menu_col.insert_one(make_dish(dish_id, cookEmail=cook['email'], cuisine='Martian',
+                                                city=cook.get('city'), version=homemeals.next_version()))
+    homemeals.menu_col.delete_one({'_id': 'remote-2'})
+    homemeals.record_tombstone('dish', 'remote-2', cook['email'])
+
+    after = client.get('/api/dishes/filter?cuisine=Martian&isAvailable=any').get_json()
+    assert after['count'] == 1
+    assert [d['_id'] for d in after['dishes']] == ['remote-1']
+    assert after['facets']['cuisine']['Martian'] == 1
+
+    homemeals.menu_col.delete_one({'_id': 'remote-1'})
+    homemeals.record_tombstone('dish', 'remote-1', cook['email'])
+    assert client.get('/api/dishes/filter?cuisine=Martian&isAvailable=any').get_json()['count'] == 0
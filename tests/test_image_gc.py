@@ -0,0 +1,37 @@
+import os
+
+import pytest
+
+
+@pytest.fixture
+def food_folder(homemeals, tmp_path, monkeypatch):
+    monkeypatch.setattr(homemeals, 'IMAGE_GC_TARGETS', [('food', str(tmp_path), 'menu', 'image', 'imageUrl')])
+    monkeypatch.setattr(homemeals, 'IMAGE_GC_STATE_PATH', str(tmp_path.parent / 'gc-state.json'))
+    monkeypatch.setattr(homemeals, 'IMAGE_GC_GRACE_SECONDS', 0)
+    monkeypatch.setattr(homemeals, 'IMAGE_GC_FILES_PER_SECOND', 0)
+    return tmp_path
+
+
+def test_gc_keeps_url_references_and_sample_images(homemeals, food_folder):
+    cook = homemeals.sample_cooks[0]
+    homemeals.menu_col.insert_one({'cookEmail': cook['email'], 'name': 'Url Only', 'image': None,
+                                   'imageUrl': 'http://cdn.example.test/static/food/url%20only.jpg'})
+    seeded = homemeals.sample_dishes[0]['image']
+    for name in ('url only.jpg', seeded, 'orphan.jpg'):
+        (food_folder / name).write_bytes(b'x')
+
+    report = homemeals.collect_orphaned_images()
+
+    assert report['freed'] == ['food/orphan.jpg']
+    assert sorted(os.listdir(food_folder)) == sorted(['url only.jpg', seeded])
+
+
+def test_gc_endpoint_requires_admin_token(homemeals, client, food_folder, monkeypatch):
+    (food_folder / 'orphan.jpg').write_bytes(b'x')
+    assert client.post('/api/admin/gc-images').status_code == 403
+
+    monkeypatch.setattr(homemeals, 'ADMIN_TOKEN', 'admin-secret')
+    assert client.post('/api/admin/gc-images', headers={'X-Admin-Token': 'wrong'}).status_code == 403
+    response = client.post('/api/admin/gc-images?dryRun=true', headers={'X-Admin-Token': 'admin-secret'})
+    assert response.status_code == 200
+    assert response.get_json()['freed'] == ['food/orphan.jpg']
@@ -0,0 +1,105 @@
+import pytest
+
+
+@pytest.fixture
+def collections(homemeals, monkeypatch):
+    """Empty in-memory collections without the partition and facet indexes attached"""
+    fresh = {'users': [], 'menu': [], 'orders': []}
+    monkeypatch.setattr(homemeals, 'memory_collections', fresh)
+    monkeypatch.setattr(homemeals, 'MEMORY_INDEXES', {})
+    return fresh
+
+
+def write_segment(homemeals, journal, records, tail=b''):
+    with open(journal.segment_path(0), 'wb') as f:
+        for record in records:
+            f.write(homemeals.encode_journal_line(record))
+        f.write(tail)
+
+
+def live_writes(homemeals):
+    """Apply a run of writes the way write_memory_record does and return the journal records"""
+    records = [
+        {'op': 'insert', 'col': 'menu', 'docs': homemeals.stamp_memory_ids(
+            [{'name': f'Dish {i}', 'cookEmail': 'a@x.test' if i % 2 else 'b@x.test', 'price': i} for i in range(6)])},
+        {'op': 'update', 'col': 'menu', 'match': {'name': 'Dish 1'}, 'set': {'price': 100}, 'multi': False},
+        {'op': 'update', 'col': 'menu', 'match': {'cookEmail': 'b@x.test'}, 'set': {'isAvailable': False}, 'multi': True},
+        {'op': 'delete', 'col': 'menu', 'match': {'name': 'Dish 3'}},
+        {'op': 'update', 'col': 'menu', 'match': {'name': 'Dish 5'}, 'set': {}, 'multi': False, 'inc': {'price': 2}},
+    ]
+    for record in records:
+        homemeals.apply_memory_record(record)
+    return records
+
+
+def test_replay_rebuilds_collections(homemeals, collections, tmp_path):
+    records = live_writes(homemeals)
+    expected = [dict(doc) for doc in collections['menu']]
+    collections['menu'].clear()
+
+    journal = homemeals.MemoryJournal(str(tmp_path))
+    write_segment(homemeals, journal, records)
+    journal.recover()
+
+    assert [dict(doc) for doc in collections['menu']] == expected
+    assert journal.recovered_records == len(records)
+    by_name = {doc['name']: doc for doc in collections['menu']}
+    assert 'Dish 3' not in by_name
+    assert by_name['Dish 1']['price'] == 100
+    assert by_name['Dish 5']['price'] == 7
+    assert by_name['Dish 0']['isAvailable'] is False
+
+
+def test_replay_looks_up_documents_by_id(homemeals, collections, tmp_path, monkeypatch):
+    records = live_writes(homemeals)
+    assert all('ids' in r for r in records if r['op'] in ('update', 'delete'))
+    collections['menu'].clear()
+
+    def no_scan(doc, match):
+        raise AssertionError('replay scanned the collection')
+
+    monkeypatch.setattr(homemeals, 'doc_matches', no_scan)
+    journal = homemeals.MemoryJournal(str(tmp_path))
+    write_segment(homemeals, journal, records)
+    journal.recover()
+    assert len(collections['menu']) == 5
+
+
+def test_replay_scans_records_without_ids(homemeals, collections, tmp_path):
+    records = [
+        {'op': 'insert', 'col': 'users', 'docs': [{'email': 'a@x.test', 'type': 'cook'}, {'email': 'b@x.test', 'type': 'customer'}]},
+        {'op': 'update', 'col': 'users', 'match': {'email': 'a@x.test'}, 'set': {'name': 'A'}, 'multi': False},
+        {'op': 'delete', 'col': 'users', 'match': {'email': 'b@x.test'}},
+    ]
+    journal = homemeals.MemoryJournal(str(tmp_path))
+    write_segment(homemeals, journal, records)
+    journal.recover()
+    assert [dict(doc) for doc in collections['users']] == [{'email': 'a@x.test', 'type': 'cook', 'name': 'A'}]
+
+
+def test_replay_stops_at_torn_record(homemeals, collections, tmp_path):
+    records = [{'op': 'insert', 'col': 'orders', 'docs': [{'_id': 'o1', 'status': 'pending'}]}]
+    journal = homemeals.MemoryJournal(str(tmp_path))
+    write_segment(homemeals, journal, records, tail=b'{"op": "delete", "col": "ord')
+    journal.recover()
+    assert [doc['_id'] for doc in collections['orders']] == ['o1']
+    assert journal.recovered_records == 1
+
+
+def test_snapshot_then_replay(homemeals, collections, tmp_path):
+    journal = homemeals.MemoryJournal(str(tmp_path))
+    journal.file = open(journal.segment_path(0), 'ab')
+    for record in live_writes(homemeals):
+        journal.append(record)
+    journal.snapshot()
+    record = {'op': 'delete', 'col': 'menu', 'match': {'name': 'Dish 0'}}
+    homemeals.apply_memory_record(record)
+    journal.append(record)
+    journal.close()
+    expected = [dict(doc) for doc in collections['menu']]
+
+    collections['menu'].clear()
+    recovered = homemeals.MemoryJournal(str(tmp_path))
+    recovered.recover()
+    assert [dict(doc) for doc in collections['menu']] == expected
+    assert recovered.segment == 1
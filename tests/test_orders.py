@@ -0,0 +1,60 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+
+def auth(homemeals, email, user_type):
+    token, _ = homemeals.issue_session_token({'email': email, 'type': user_type})
+    return {'Authorization': f'Bearer {token}'}
+
+
+@pytest.fixture(scope='module')
+def history(homemeals):
+    """Forty days of orders for one cook, one per day at noon"""
+    cook = 'history-cook@x.test'
+    start = datetime(2024, 3, 1, 12)
+    homemeals.orders_col.insert_many([
+        {'orderId': f'HIST-{i:03d}', 'cookEmail': cook, 'customerEmail': 'diner@x.test',
+         'createdAt': start + timedelta(days=i), 'items': [], 'status': 'delivered'}
+        for i in range(40)
+    ])
+    return cook
+
+
+def test_history_is_newest_first_within_the_range(homemeals, history):
+    orders = homemeals.cook_order_history(history, '2024-03-05', '2024-03-14', limit=4)
+    assert [o['orderId'] for o in orders] == ['HIST-013', 'HIST-012', 'HIST-011', 'HIST-010']
+    orders = homemeals.cook_order_history(history, '2024-04-08')
+    assert [o['orderId'] for o in orders] == ['HIST-039', 'HIST-038']
+
+
+def test_history_query_uses_the_cook_and_date_index(homemeals, history):
+    where, params, remaining = homemeals.orders_col.where_clause(
+        {'cookEmail': history, 'createdAt': {'$gte': datetime(2024, 3, 5)}})
+    assert not remaining
+    plan = homemeals.sqlite_store.connection().execute(
+        f'EXPLAIN QUERY PLAN SELECT doc FROM "orders"{where} ORDER BY "createdAt" DESC LIMIT 5', params).fetchall()
+    detail = ' '.join(row[-1] for row in plan)
+    assert 'orders_cookEmail_createdAt' in detail
+    assert 'TEMP B-TREE' not in detail
+
+
+def test_order_reads_need_the_cook_or_customer(homemeals, client, history):
+    url = '/api/orders/HIST-001'
+    assert client.get(url).status_code == 401
+    assert client.get(url, headers=auth(homemeals, 'stranger@x.test', 'customer')).status_code == 403
+    assert client.get(url, headers=auth(homemeals, 'diner@x.test', 'customer')).status_code == 200
+    assert client.get(url, headers=auth(homemeals, history, 'cook')).status_code == 200
+
+    url = f'/api/cooks/{history}/orders?limit=3'
+    assert client.get(url).status_code == 401
+    assert client.get(url, headers=auth(homemeals, 'diner@x.test', 'customer')).status_code == 403
+    response = client.get(url, headers=auth(homemeals, history, 'cook'))
+    assert response.status_code == 200
+    assert response.get_json()['count'] == 3
+    bad_range = client.get(f'/api/cooks/{history}/orders?from=March', headers=auth(homemeals, history, 'cook'))
+    assert bad_range.status_code == 400
+
+
+def test_archive_run_requires_admin(client):
+    assert client.post('/api/admin/orders-archive').status_code == 403
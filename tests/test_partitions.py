@@ -0,0 +1,35 @@
+def dish_count(client, email, tag):
+    # A query string of its own keeps the response out of the listing cache
+    response = client.get(f'/api/cooks/{email}/dishes?case={tag}')
+    assert response.status_code == 200
+    return response.get_json()['count']
+
+
+def test_menu_survives_a_move_made_by_another_worker(homemeals, client):
+    email = homemeals.sample_cooks[1]['email']
+    before = dish_count(client, email, 'before')
+    assert before > 0
+
+    # Another worker moves the cook: this one has no say in it and keeps no route for it
+    changes = homemeals.stamp_version({'city': 'Jaipur'})
+    homemeals.users_col.update_one({'email': email, 'type': 'cook'}, {'$set': changes})
+    homemeals.menu_col.update_many({'cookEmail': email}, {'$set': changes})
+    assert dish_count(client, email, 'after') == before
+
+
+def test_dish_added_during_a_move_follows_the_cook(homemeals):
+    email = homemeals.sample_cooks[0]['email']
+    stale_cook = dict(homemeals.users_col.find_one({'email': email, 'type': 'cook'}))
+    old_city = homemeals.dish_city(stale_cook)
+
+    # The add read the cook before the move and inserts after the move re-stamped the dishes
+    homemeals.move_cook(email, 'Kochi' if old_city != 'Kochi' else 'Pune')
+    fields = {'name': 'Late dish', 'description': 'Added mid-move', 'price': 100, 'category': 'Main Course',
+              'cuisine': 'North Indian', 'spiceLevel': 'Mild', 'prepTime': 20}
+    dish = homemeals.build_dish_data(stale_cook, fields, None, homemeals.placeholder_url('dish'), None)
+    assert dish['city'] == old_city
+    homemeals.menu_col.insert_one(dish)
+    homemeals.settle_dish_city(email, old_city)
+
+    cities = {d['city'] for d in homemeals.menu_col.find({'cookEmail': email})}
+    assert cities == {homemeals.city_of_cook(email)}
@@ -0,0 +1,102 @@
+import pytest
+from bson import Timestamp
+
+
+class FakeSession:
+    def __init__(self):
+        self.operation_time = None
+        self.ended = False
+
+    def advance_operation_time(self, operation_time):
+        self.operation_time = operation_time
+
+    def end_session(self):
+        self.ended = True
+
+
+class FakeClient:
+    def __init__(self):
+        self.sessions = []
+
+    def start_session(self, causal_consistency=False):
+        assert causal_consistency
+        self.sessions.append(FakeSession())
+        return self.sessions[-1]
+
+
+class FakeCollection:
+    def __init__(self):
+        self.calls = []
+
+    def find_one(self, *args, **kwargs):
+        self.calls.append(kwargs)
+        return None
+
+
+@pytest.fixture
+def mongo(homemeals, monkeypatch):
+    fake = FakeClient()
+    monkeypatch.setattr(homemeals, 'USE_MONGODB', True)
+    # Only a MongoDB deployment has a client
+    monkeypatch.setattr(homemeals, 'client', fake, raising=False)
+    return fake
+
+
+def run_hooks(homemeals, path, method='GET', status=200, headers=None, during=None):
+    """Run the session hooks around one request; returns the response and the session it ran in"""
+    with homemeals.app.test_request_context(path, method=method, headers=headers or {}):
+        homemeals.start_causal_session()
+        session = homemeals.request_mongo_session()
+        if during:
+            during(session)
+        response = homemeals.issue_causal_cookie(homemeals.app.response_class('{}', status=status))
+        homemeals.end_causal_session()
+    return response, session
+
+
+def write_reply(session):
+    session.operation_time = Timestamp(1700000000, 7)
+
+
+def test_token_round_trip_and_rejection(homemeals, monkeypatch):
+    token = homemeals.issue_causal_token(Timestamp(1700000000, 7))
+    assert homemeals.causal_token_time(token) == Timestamp(1700000000, 7)
+    seconds, inc, issued, signature = token.split('.')
+    assert homemeals.causal_token_time(f'{seconds}.{int(inc) + 1}.{issued}.{signature}') is None
+    assert homemeals.causal_token_time('not-a-token') is None
+    monkeypatch.setattr(homemeals, 'CAUSAL_TOKEN_TTL', -1)
+    assert homemeals.causal_token_time(token) is None
+
+
+def test_a_write_hands_back_its_operation_time(homemeals, mongo):
+    response, session = run_hooks(homemeals, '/api/dishes/add', 'POST', 201, during=write_reply)
+    assert session is mongo.sessions[0] and session.ended
+    token = response.headers['X-Read-After']
+    assert homemeals.causal_token_time(token) == Timestamp(1700000000, 7)
+    assert f'{homemeals.CAUSAL_COOKIE}={token}' in response.headers['Set-Cookie']
+
+
+def test_a_failed_write_hands_back_nothing(homemeals, mongo):
+    response, _ = run_hooks(homemeals, '/api/dishes/add', 'POST', 400, during=write_reply)
+    assert 'X-Read-After' not in response.headers
+
+
+def test_a_catalog_read_continues_from_the_token(homemeals, mongo):
+    token = homemeals.issue_causal_token(Timestamp(1700000000, 7))
+    collection = FakeCollection()
+    guarded = homemeals.GuardedCollection(collection, homemeals.CircuitBreaker(3, 1, 1))
+
+    response, session = run_hooks(homemeals, '/api/cooks', headers={'X-Read-After': token},
+                                  during=lambda session: guarded.find_one({}))
+    assert session.operation_time == Timestamp(1700000000, 7)
+    assert collection.calls == [{'session': session}]
+    # A causal read does not refresh the token
+    assert 'X-Read-After' not in response.headers
+
+
+def test_reads_without_a_valid_token_run_without_a_session(homemeals, mongo):
+    _, session = run_hooks(homemeals, '/api/cooks')
+    assert session is None
+    _, session = run_hooks(homemeals, '/api/cooks', headers={'X-Read-After': '1.2.3.forged'})
+    assert session is None
+    assert mongo.sessions == []
@@ -0,0 +1,61 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+
+@pytest.fixture
+def orders(homemeals, tmp_path):
+    store = homemeals.SQLiteStore(str(tmp_path / 'store.sqlite3'))
+    collection = homemeals.SQLiteCollection(store, 'orders', ['cookEmail', 'createdAt', 'total'])
+    start = datetime(2024, 1, 1)
+    collection.insert_many([
+        {'_id': f'o{i}', 'cookEmail': 'a@x.test' if i % 3 else 'b@x.test', 'createdAt': start + timedelta(hours=i),
+         'total': (i * 7) % 10, 'status': 'delivered' if i % 2 else 'pending'}
+        for i in range(20)
+    ])
+    statements = []
+    store.connection().set_trace_callback(statements.append)
+    collection.statements = statements
+    return collection
+
+
+def ids(docs):
+    return [doc['_id'] for doc in docs]
+
+
+def test_sort_skip_limit_run_in_sql(orders):
+    docs = list(orders.find({'cookEmail': 'a@x.test'}).sort('createdAt', -1).skip(2).limit(3))
+    assert ids(docs) == ['o16', 'o14', 'o13']
+    select = [s for s in orders.statements if s.startswith('SELECT')][-1]
+    assert 'ORDER BY "createdAt" DESC' in select
+    assert 'LIMIT 3 OFFSET 2' in select
+
+
+def test_find_one_reads_a_single_row(orders):
+    doc = orders.find_one({'createdAt': {'$gte': datetime(2024, 1, 1, 5)}})
+    assert doc['_id'] == 'o5'
+    assert 'LIMIT 1 OFFSET 0' in orders.statements[-1]
+
+
+def test_compound_sort_matches_python_order(orders):
+    docs = list(orders.find({}).sort([('total', 1), ('createdAt', -1)]))
+    expected = sorted(orders.query({}), key=lambda d: (d['total'], -d['createdAt'].timestamp()))
+    assert ids(docs) == ids(expected)
+
+
+def test_unindexed_filter_applies_skip_and_limit_after_matching(orders):
+    docs = list(orders.find({'status': 'delivered'}).sort('createdAt', 1).skip(1).limit(2))
+    assert ids(docs) == ['o3', 'o5']
+    assert 'LIMIT' not in orders.statements[-1]
+
+
+def test_sort_on_unindexed_field_falls_back_to_python(orders):
+    docs = list(orders.find({'cookEmail': 'b@x.test'}).sort('status', -1).limit(2))
+    assert [doc['status'] for doc in docs] == ['pending', 'pending']
+    assert len(docs) == 2
+
+
+def test_update_one_changes_only_the_first_match(orders):
+    result = orders.update_one({'cookEmail': 'b@x.test'}, {'$set': {'status': 'seen'}})
+    assert result.matched_count == 1
+    assert orders.count_documents({'status': 'seen'}) == 1